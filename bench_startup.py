@@ -0,0 +1,64 @@
+"""启动耗时基准：测量冷启动加载配置的耗时，超出预算或引入重量级依赖时返回非零退出码"""
+import sys
+import json
+import argparse
+import subprocess
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+
+# 加载配置阶段不应引入的GUI/网络依赖
+HEAVY_MODULES = ["openai", "requests", "pyautogui", "mss", "pygetwindow", "pyperclip"]
+
+# 在全新解释器中执行，避免已缓存的模块影响测量
+PROBE = """
+import sys, time, json
+start = time.perf_counter()
+import main
+from modules.config_loader import load_config, validate_config
+validate_config(load_config())
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{"elapsed_ms": elapsed * 1000, "heavy": heavy}}))
+"""
+
+
+def run_probe() -> dict:
+    code = PROBE.format(heavy=HEAVY_MODULES)
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="冷启动耗时基准")
+    parser.add_argument("--budget-ms", type=float, default=150.0, help="冷启动耗时预算(毫秒)")
+    parser.add_argument("--runs", type=int, default=5, help="测量次数，取最小值")
+    args = parser.parse_args()
+
+    results = [run_probe() for _ in range(args.runs)]
+    best = min(r["elapsed_ms"] for r in results)
+    heavy = sorted({m for r in results for m in r["heavy"]})
+
+    print(f"[Bench] 冷启动加载配置: 最快 {best:.1f}ms (预算 {args.budget_ms:.0f}ms, {args.runs} 次)")
+
+    failed = False
+    if heavy:
+        print(f"[Bench] 失败: 加载配置时引入了重量级依赖: {', '.join(heavy)}")
+        failed = True
+    if best > args.budget_ms:
+        print(f"[Bench] 失败: 冷启动耗时超出预算 {best - args.budget_ms:.1f}ms")
+        failed = True
+
+    if not failed:
+        print("[Bench] 通过")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
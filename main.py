@@ -2,19 +2,51 @@ import sys
 import time
 import random
 import signal
+import argparse
 
-from modules.config_loader import load_config
-from modules.ai_client import AIClient
-from modules.baidu_ocr import BaiduOCR
-from modules.wechat_monitor import WeChatMonitor
+from modules.config_loader import ConfigWatcher, load_config, validate_config
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="微信智能自动回复系统")
+    parser.add_argument("--config", default=None, help="配置文件路径（默认使用项目根目录下的 config.yaml）")
+    parser.add_argument(
+        "--check-config",
+        action="store_true",
+        help="只校验配置文件后退出，不加载GUI/网络相关依赖",
+    )
+    return parser.parse_args(argv)
+
+
+def check_config(config_path: str | None = None) -> int:
+    """校验配置文件，返回进程退出码"""
+    try:
+        config = load_config(config_path)
+    except Exception as e:
+        print(f"[Error] 配置加载失败: {e}")
+        return 1
+
+    errors = validate_config(config)
+    for err in errors:
+        print(f"[Error] {err}")
+    if errors:
+        return 1
+
+    print("[Config] 配置校验通过")
+    return 0
 
 
 def main():
+    args = parse_args()
+    if args.check_config:
+        sys.exit(check_config(args.config))
+
     print("=== 微信智能自动回复系统 ===")
 
     # 加载配置
     try:
-        config = load_config()
+        watcher = ConfigWatcher(args.config)
+        config = load_config(args.config)
         print(f"[Config] 已加载配置")
         print(f"[Config] AI: {config.api.provider}")
         print(f"[Config] 风格: {config.style.default}")
@@ -22,19 +54,22 @@ def main():
         print(f"[Error] 配置加载失败: {e}")
         sys.exit(1)
 
-    # 检查API Key
-    if not config.api.api_key:
-        print("[Error] 未设置AI API Key")
+    # 校验配置
+    errors = validate_config(config)
+    if errors:
+        for err in errors:
+            print(f"[Error] {err}")
         sys.exit(1)
 
-    if not config.baidu_ocr.api_key or not config.baidu_ocr.secret_key:
-        print("[Error] 未设置百度OCR API Key")
-        sys.exit(1)
+    # 初始化模块（GUI/网络依赖在此时才加载）
+    from modules.ai_client import AIClient
+    from modules.baidu_ocr import BaiduOCR
+    from modules.wechat_monitor import WeChatMonitor
+    from modules.text_filter import TextFilter
 
-    # 初始化模块
     ai_client = AIClient(config.api)
     ocr = BaiduOCR(config.baidu_ocr.api_key, config.baidu_ocr.secret_key)
-    monitor = WeChatMonitor(ocr)
+    monitor = WeChatMonitor(ocr, TextFilter(config.filter))
 
     # 查找微信窗口
     if not monitor.find_wechat_window():
@@ -62,6 +97,28 @@ def main():
     # 主循环
     while running:
         try:
+            # 配置文件有变化时在本轮开始前切换到新配置
+            new_config = watcher.poll()
+            if new_config:
+                # 先构建所有新组件，全部成功后再一起切换，任何一步失败都保留旧配置
+                try:
+                    new_ai_client = AIClient(new_config.api) if new_config.api != config.api else ai_client
+                    new_ocr = None
+                    if new_config.baidu_ocr != config.baidu_ocr:
+                        new_ocr = BaiduOCR(new_config.baidu_ocr.api_key, new_config.baidu_ocr.secret_key)
+                    new_filter = TextFilter(new_config.filter) if new_config.filter != config.filter else None
+                except Exception as e:
+                    print(f"[Config] 应用新配置失败，继续使用旧配置（修改配置文件后重试）: {e}")
+                else:
+                    ai_client = new_ai_client
+                    if new_ocr:
+                        monitor.set_ocr(new_ocr)
+                    if new_filter:
+                        monitor.set_text_filter(new_filter)
+                    config = new_config
+                    print("[Config] 已重新加载配置")
+                    print(f"[Config] 风格: {config.style.default}，每 {config.monitor.check_interval} 秒检查一次")
+
             # 检查新消息
             new_msg = monitor.check_new_message()
 
@@ -96,6 +153,12 @@ def main():
             print(f"[Error] {e}")
             time.sleep(config.monitor.check_interval)
 
+    hit_counts = monitor.text_filter.hit_counts
+    if hit_counts:
+        print("[Filter] 过滤规则命中统计:")
+        for rule, count in hit_counts.items():
+            print(f"  {count:>6}  {rule}")
+
     print("[System] 已退出")
 
 
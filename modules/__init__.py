@@ -1,4 +1,26 @@
-from .config_loader import load_config
-from .ai_client import AIClient
-from .baidu_ocr import BaiduOCR
-from .wechat_monitor import WeChatMonitor
+import importlib
+
+# 按需加载子模块，避免仅加载配置时就引入 openai / pyautogui / mss 等重量级依赖
+_LAZY_ATTRS = {
+    "load_config": ".config_loader",
+    "ConfigWatcher": ".config_loader",
+    "AIClient": ".ai_client",
+    "BaiduOCR": ".baidu_ocr",
+    "WeChatMonitor": ".wechat_monitor",
+    "TextFilter": ".text_filter",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,17 +1,12 @@
-import sys
-from pathlib import Path
-
-from openai import OpenAI
-
-# 添加父目录到path以支持prompts导入
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from .config_loader import ApiConfig
 from prompts.style_templates import get_system_prompt
 
 
 class AIClient:
     def __init__(self, config: ApiConfig):
+        # openai 导入较慢，延迟到实际创建客户端时再加载
+        from openai import OpenAI
+
         self._client = OpenAI(
             api_key=config.api_key,
             base_url=config.base_url,
@@ -1,8 +1,6 @@
 import os
 import base64
 
-import requests
-
 
 class BaiduOCR:
     TOKEN_URL = "https://aip.baidubce.com/oauth/2.0/token"
@@ -17,6 +15,8 @@ class BaiduOCR:
         if self._access_token:
             return self._access_token
 
+        import requests
+
         params = {
             "grant_type": "client_credentials",
             "client_id": self._api_key,
@@ -29,6 +29,8 @@ class BaiduOCR:
 
     def recognize(self, image_path: str) -> list[dict]:
         """识别图片中的文字，返回带位置信息的结果"""
+        import requests
+
         token = self._get_access_token()
 
         with open(image_path, "rb") as f:
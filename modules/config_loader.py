@@ -1,9 +1,11 @@
 import os
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import yaml
 
+DEFAULT_CONFIG_PATH = Path(__file__).parent.parent / "config.yaml"
+
 
 @dataclass
 class ApiConfig:
@@ -32,20 +34,48 @@ class MonitorConfig:
     reply_delay_max: int
 
 
+# 默认过滤的UI元素关键词
+DEFAULT_FILTER_KEYWORDS = [
+    "搜索", "发送", "表情", "文件", "截图", "聊天记录",
+    "折叠", "置顶", "通讯录", "收藏", "朋友圈", "小程序",
+    "视频号", "看一看", "游戏", "设置", "关于",
+    "撤回了一条消息", "微信红包", "领取红包", "以下为新消息",
+]
+
+# 默认过滤的正则（时间戳，如 14:15, 昨天 14:15, 2025/12/19, 星期一）
+DEFAULT_FILTER_PATTERNS = [
+    r"^\d{1,2}:\d{2}$",
+    r"^(昨天|前天) \d{1,2}:\d{2}$",
+    r"^\d{4}/\d{1,2}/\d{1,2}$",
+    r"^星期[一二三四五六日]$",
+]
+
+
+@dataclass
+class FilterConfig:
+    min_length: int = 2  # 短于该长度的文本视为噪声
+    keywords: list[str] = field(default_factory=lambda: list(DEFAULT_FILTER_KEYWORDS))
+    patterns: list[str] = field(default_factory=lambda: list(DEFAULT_FILTER_PATTERNS))
+
+
 @dataclass
 class Config:
     api: ApiConfig
     baidu_ocr: BaiduOcrConfig
     style: StyleConfig
     monitor: MonitorConfig
+    filter: FilterConfig
 
 
 def load_config(config_path: str | None = None) -> Config:
     if config_path is None:
-        config_path = Path(__file__).parent.parent / "config.yaml"
+        config_path = DEFAULT_CONFIG_PATH
 
     with open(config_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml.safe_load(f) or {}
+
+    if not isinstance(data, dict):
+        raise ValueError(f"配置文件格式错误: {config_path}")
 
     api_data = data.get("api", {})
     api_key = os.environ.get("DEEPSEEK_API_KEY") or api_data.get("api_key", "")
@@ -76,9 +106,124 @@ def load_config(config_path: str | None = None) -> Config:
         reply_delay_max=monitor_data.get("reply_delay_max", 3),
     )
 
+    # keywords/patterns 未填写时使用内置默认列表，填写后完全替换默认列表
+    # 写成 [] 可以关闭整组默认规则
+    filter_data = data.get("filter") or {}
+    keywords = filter_data.get("keywords")
+    patterns = filter_data.get("patterns")
+    filter_config = FilterConfig(
+        min_length=filter_data.get("min_length", 2),
+        keywords=list(DEFAULT_FILTER_KEYWORDS) if keywords is None else keywords,
+        patterns=list(DEFAULT_FILTER_PATTERNS) if patterns is None else patterns,
+    )
+
     return Config(
         api=api_config,
         baidu_ocr=baidu_ocr_config,
         style=style_config,
         monitor=monitor_config,
+        filter=filter_config,
     )
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _validate_filter(filter_config: FilterConfig) -> list[str]:
+    from .text_filter import TextFilter
+
+    errors = []
+    min_length = filter_config.min_length
+    if not isinstance(min_length, int) or isinstance(min_length, bool) or min_length < 0:
+        errors.append("filter.min_length 必须是非负整数")
+    if not isinstance(filter_config.keywords, list):
+        errors.append("filter.keywords 必须是列表")
+    elif not all(isinstance(kw, str) and kw for kw in filter_config.keywords):
+        errors.append("filter.keywords 只能包含非空字符串")
+    if not isinstance(filter_config.patterns, list):
+        errors.append("filter.patterns 必须是列表")
+    elif not all(isinstance(pattern, str) and pattern for pattern in filter_config.patterns):
+        errors.append("filter.patterns 只能包含非空字符串")
+    if errors:
+        return errors
+
+    # 与运行时相同的合并编译，保证校验通过的配置一定能构建过滤器
+    try:
+        TextFilter.build_regex(filter_config)
+    except ValueError as e:
+        errors.append(str(e))
+    return errors
+
+
+def validate_config(config: Config) -> list[str]:
+    """校验配置内容，返回错误信息列表（为空表示通过）"""
+    errors = []
+    if not config.api.api_key:
+        errors.append("未设置AI API Key")
+    if not config.baidu_ocr.api_key or not config.baidu_ocr.secret_key:
+        errors.append("未设置百度OCR API Key")
+    if not isinstance(config.style.default, str) or not isinstance(config.style.custom_prompt, str):
+        errors.append("style.default 和 style.custom_prompt 必须是字符串")
+
+    monitor = config.monitor
+    numeric_errors = [
+        f"monitor.{name} 必须是数字: {value!r}"
+        for name, value in (
+            ("check_interval", monitor.check_interval),
+            ("reply_delay_min", monitor.reply_delay_min),
+            ("reply_delay_max", monitor.reply_delay_max),
+        )
+        if not _is_number(value)
+    ]
+    errors.extend(numeric_errors)
+    if not numeric_errors:
+        if monitor.check_interval <= 0:
+            errors.append("check_interval 必须大于0")
+        if monitor.reply_delay_min < 0 or monitor.reply_delay_min > monitor.reply_delay_max:
+            errors.append("reply_delay_min 必须在 0 与 reply_delay_max 之间")
+    errors.extend(_validate_filter(config.filter))
+    return errors
+
+
+class ConfigWatcher:
+    """监视配置文件变化，变化时重新加载并校验，校验失败则保留旧配置"""
+
+    def __init__(self, config_path: str | None = None):
+        self._path = Path(config_path) if config_path else DEFAULT_CONFIG_PATH
+        self._signature = self._stat()
+
+    def _stat(self) -> tuple[int, int] | None:
+        try:
+            st = os.stat(self._path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def poll(self) -> Config | None:
+        """文件有变化且新配置有效时返回新配置，否则返回None
+
+        无效的文件会被记住，直到再次修改前不会重复加载。
+        """
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            return None
+        # 无论新配置是否有效都记录签名，避免每次轮询重复报错
+        self._signature = signature
+
+        try:
+            config = load_config(self._path)
+        except Exception as e:
+            print(f"[Config] 重新加载失败，继续使用旧配置: {e}")
+            return None
+
+        try:
+            errors = validate_config(config)
+        except Exception as e:
+            errors = [f"校验出错: {e}"]
+        if errors:
+            for err in errors:
+                print(f"[Config] 新配置无效，继续使用旧配置: {err}")
+            return None
+
+        return config
@@ -0,0 +1,97 @@
+import re
+from collections import Counter
+
+from .config_loader import FilterConfig
+
+
+class TextFilter:
+    """OCR文本过滤器：所有关键词和正则规则在加载时合并编译为一个正则，单次匹配即可分类"""
+
+    LENGTH_RULE = "length"
+
+    # 合并为一个正则后无法保持原义的写法：反向引用（分组编号会整体偏移）
+    _BACKREF = re.compile(r"(?<!\\)(?:\\\\)*\\[1-9]|\(\?P=")
+
+    def __init__(self, config: FilterConfig):
+        self._min_length = config.min_length
+        self._regex, self._rule_names = self.build_regex(config)
+        self._hits: Counter[str] = Counter()
+        # 每次轮询都会重新识别同一屏内容，只统计上一帧中没有出现过的文本
+        self._previous_frame: set[str] = set()
+        self._current_frame: set[str] = set()
+
+    @classmethod
+    def check_pattern(cls, pattern: str) -> None:
+        """检查单条正则能否安全地合并进总正则，不能则抛出 ValueError"""
+        try:
+            compiled = re.compile(pattern)
+        except re.error as e:
+            raise ValueError(f"无效的过滤正则 {pattern!r}: {e}") from e
+        if compiled.flags & ~re.UNICODE:
+            raise ValueError(f"过滤正则 {pattern!r} 不支持全局标志，请改用局部写法如 (?i:...)")
+        if compiled.groupindex:
+            raise ValueError(f"过滤正则 {pattern!r} 不支持命名分组")
+        if cls._BACKREF.search(pattern):
+            raise ValueError(f"过滤正则 {pattern!r} 不支持反向引用")
+
+    @classmethod
+    def build_regex(cls, config: FilterConfig) -> tuple[re.Pattern | None, dict[str, str]]:
+        """把所有规则合并编译为一个正则，返回 (正则, 分组名 -> 规则名)
+
+        每条规则对应一个命名分组，匹配后通过 lastgroup 得知命中的规则。
+        规则无法合并时抛出 ValueError。
+        """
+        rule_names: dict[str, str] = {}
+        alternatives = []
+
+        def add_rule(name: str, pattern: str) -> None:
+            group = f"r{len(rule_names)}"
+            rule_names[group] = name
+            alternatives.append(f"(?P<{group}>{pattern})")
+
+        for pattern in config.patterns:
+            cls.check_pattern(pattern)
+            add_rule(f"pattern:{pattern}", pattern)
+        # re.search 返回最左侧的命中，同一位置上按分组顺序取第一个：
+        # 正则规则排在关键词之前，关键词之间长的优先
+        for kw in sorted(set(config.keywords), key=len, reverse=True):
+            add_rule(f"keyword:{kw}", re.escape(kw))
+
+        if not alternatives:
+            return None, rule_names
+        try:
+            return re.compile("|".join(alternatives)), rule_names
+        except re.error as e:
+            raise ValueError(f"过滤规则合并编译失败: {e}") from e
+
+    def match(self, text: str) -> str | None:
+        """返回命中的规则名，未命中返回None"""
+        if len(text) < self._min_length:
+            rule = self.LENGTH_RULE
+        elif self._regex and (m := self._regex.search(text)):
+            rule = self._rule_names[m.lastgroup]
+        else:
+            return None
+        if text not in self._previous_frame and text not in self._current_frame:
+            self._hits[rule] += 1
+        self._current_frame.add(text)
+        return rule
+
+    def start_frame(self) -> None:
+        """开始处理新一帧OCR结果，上一帧已出现的文本不再重复计数"""
+        self._previous_frame = self._current_frame
+        self._current_frame = set()
+
+    def is_noise(self, text: str) -> bool:
+        return self.match(text) is not None
+
+    @property
+    def hit_counts(self) -> dict[str, int]:
+        """各规则过滤掉的新文本行数，按次数降序"""
+        return dict(self._hits.most_common())
+
+    def merge_stats(self, other: "TextFilter") -> None:
+        """合并另一个过滤器的命中统计（重新加载配置时保留历史统计）"""
+        self._hits.update(other._hits)
+        self._previous_frame = set(other._previous_frame)
+        self._current_frame = set(other._current_frame)
@@ -1,16 +1,12 @@
-import re
 import time
 import hashlib
 import tempfile
 from collections import OrderedDict
 from dataclasses import dataclass
 
-import mss
-import mss.tools
-import pyautogui
-import pygetwindow as gw
-
 from .baidu_ocr import BaiduOCR
+from .config_loader import FilterConfig
+from .text_filter import TextFilter
 
 
 class LRUCache:
@@ -33,6 +29,76 @@ class LRUCache:
                 self._cache.popitem(last=False)
 
 
+@dataclass
+class PanelLayout:
+    """微信窗口内各面板的边界（相对窗口左上角的像素）"""
+    left_panel_width: int = 280  # 左侧聊天列表宽度
+    top_bar_height: int = 60  # 顶部标题栏高度
+    bottom_panel_height: int = 120  # 底部输入框高度
+
+
+def _color_diff(a: tuple, b: tuple) -> int:
+    return abs(a[0] - b[0]) + abs(a[1] - b[1]) + abs(a[2] - b[2])
+
+
+def _find_vertical_edges(pixel, xs: range, ys: list[int], threshold: int, min_ratio: float) -> list[int]:
+    """在 xs 范围内寻找贯穿大多数采样行的竖直分界线，返回分界线右侧的x列表"""
+    edges = []
+    for x in xs:
+        hits = sum(1 for y in ys if _color_diff(pixel(x - 1, y), pixel(x, y)) > threshold)
+        if hits >= len(ys) * min_ratio:
+            edges.append(x)
+    return edges
+
+
+def _find_horizontal_edges(pixel, ys: range, xs: list[int], threshold: int, min_ratio: float) -> list[int]:
+    """在 ys 范围内寻找贯穿大多数采样列的水平分界线，返回分界线下方的y列表"""
+    edges = []
+    for y in ys:
+        hits = sum(1 for x in xs if _color_diff(pixel(x, y - 1), pixel(x, y)) > threshold)
+        if hits >= len(xs) * min_ratio:
+            edges.append(y)
+    return edges
+
+
+def calibrate_layout(pixel, width: int, height: int, threshold: int = 24, min_ratio: float = 0.8) -> PanelLayout:
+    """根据窗口截图自动校准面板边界，检测失败的部分回退到默认值
+
+    pixel(x, y) 返回 (r, g, b)，坐标相对窗口左上角。
+    """
+    layout = PanelLayout()
+    samples = 24
+
+    # 聊天列表与聊天区之间的竖直分割线：在窗口中部采样多行，从图标栏右侧开始
+    # 取第一条，避免把聊天区内左对齐的消息气泡边缘误认为分割线。
+    # 1~2px 宽的分割线两侧都会形成边缘，取这组相邻边缘的最右侧
+    ys = [height // 4 + i * (height // 2) // samples for i in range(samples)]
+    dividers = _find_vertical_edges(pixel, range(max(width // 8, 1), width * 3 // 5), ys, threshold, min_ratio)
+    if dividers:
+        divider = dividers[0]
+        for x in dividers[1:]:
+            if x - divider > 2:
+                break
+            divider = x
+        layout.left_panel_width = divider
+
+    # 在聊天区内采样多列，寻找标题栏下沿与输入框上沿
+    chat_left = layout.left_panel_width + 10
+    chat_right = width - 10
+    if chat_right - chat_left >= samples:
+        xs = [chat_left + i * (chat_right - chat_left) // samples for i in range(samples)]
+
+        top_edges = _find_horizontal_edges(pixel, range(1, height // 5), xs, threshold, min_ratio)
+        if top_edges:
+            layout.top_bar_height = top_edges[-1]
+
+        bottom_edges = _find_horizontal_edges(pixel, range(height // 2, height - 1), xs, threshold, min_ratio)
+        if bottom_edges:
+            layout.bottom_panel_height = height - bottom_edges[0]
+
+    return layout
+
+
 @dataclass
 class ChatMessage:
     text: str
@@ -41,21 +107,18 @@ class ChatMessage:
 
 
 class WeChatMonitor:
-    # 需要过滤的UI元素关键词
-    UI_KEYWORDS = [
-        "搜索", "发送", "表情", "文件", "截图", "聊天记录",
-        "折叠", "置顶", "通讯录", "收藏", "朋友圈", "小程序",
-        "视频号", "看一看", "游戏", "设置", "关于",
-    ]
-
-    # 时间戳正则（如 14:15, 2025/12/19, 星期一）
-    TIME_PATTERN = re.compile(r"^\d{1,2}:\d{2}$|^\d{4}/\d{1,2}/\d{1,2}$|^星期[一二三四五六日]$")
-
-    def __init__(self, ocr: BaiduOCR):
+    def __init__(self, ocr: BaiduOCR, text_filter: TextFilter | None = None):
         self._ocr = ocr
+        self._text_filter = text_filter or TextFilter(FilterConfig())
         self._processed_messages = LRUCache(1000)
         self._window = None
+        self._window_box = None  # 上次成功校准时的窗口位置和大小
+        self._layout = PanelLayout()
         self._chat_region = None  # 聊天区域坐标
+        # 校准失败后按指数退避重试，避免每次轮询都重新截图
+        self._calibrate_failures: int = 0
+        self._calibrate_retry_at: float = 0  # 下次允许重试的时间
+        self._calibrate_retry_max: float = 120.0  # 最大退避时间(秒)
         self._last_messages: list[str] = []
         # 防止回复自己消息的机制
         self._recent_sent_texts: list[str] = []  # 最近发送的消息
@@ -63,13 +126,15 @@ class WeChatMonitor:
         self._send_cooldown: float = 5.0  # 发送后冷却时间(秒)
 
     def find_wechat_window(self) -> bool:
+        import pygetwindow as gw
+
         windows = gw.getWindowsWithTitle("微信")
         for win in windows:
             if win.title == "微信":
                 self._window = win
-                self._calculate_chat_region()
+                self._window_box = None
                 print(f"[WeChat] 找到窗口: {win.width}x{win.height}")
-                print(f"[WeChat] 聊天区域: {self._chat_region}")
+                self._refresh_geometry()
                 return True
         print("[WeChat] 未找到微信窗口")
         return False
@@ -86,21 +151,70 @@ class WeChatMonitor:
                     count += 1
         return count
 
-    def _calculate_chat_region(self):
-        """计算聊天消息区域（排除左侧列表和底部输入框）"""
+    def _refresh_geometry(self) -> None:
+        """检查窗口位置和大小，发生变化时重新校准聊天区域"""
         if not self._window:
             return
 
-        # 微信布局：左侧聊天列表约280px，底部输入框约100px
-        left_panel_width = 280
-        bottom_panel_height = 120
-        top_bar_height = 60
+        # 最小化的窗口会被移到屏幕外（如 -32000, -32000），保留原有布局和区域
+        if self._window.isMinimized:
+            return
+
+        box = tuple(self._window.box)
+        if box == self._window_box:
+            return
+
+        if self._calibrate_failures and time.time() < self._calibrate_retry_at:
+            # 退避期间不截图，只让区域跟随窗口移动
+            self._calculate_chat_region(box)
+            return
+
+        left, top, width, height = box
+        try:
+            layout = self._calibrate_layout(left, top, width, height)
+        except Exception as e:
+            # 不记录本次窗口位置，退避一段时间后重试校准
+            self._calibrate_failures += 1
+            delay = min(5.0 * 2 ** (self._calibrate_failures - 1), self._calibrate_retry_max)
+            self._calibrate_retry_at = time.time() + delay
+            # 窗口大小未变时沿用上次校准的布局，否则暂用默认布局
+            if not self._window_box or self._window_box[2:] != box[2:]:
+                self._layout = PanelLayout()
+            self._calculate_chat_region(box)
+            print(f"[WeChat] 自动校准失败，{delay:.0f}秒后重试: {e}")
+            return
+
+        self._calibrate_failures = 0
+        self._layout = layout
+        self._window_box = box
+        self._calculate_chat_region(box)
+        print(f"[WeChat] 聊天区域已更新: {self._chat_region}")
+
+    def _calibrate_layout(self, left: int, top: int, width: int, height: int) -> PanelLayout:
+        """截取整个窗口并检测聊天列表分割线和输入框边缘"""
+        import mss
 
+        with mss.mss() as sct:
+            frame = sct.grab({"left": left, "top": top, "width": width, "height": height})
+
+        rgb = frame.rgb
+        frame_width = frame.width
+
+        def pixel(x: int, y: int) -> tuple:
+            i = (y * frame_width + x) * 3
+            return rgb[i], rgb[i + 1], rgb[i + 2]
+
+        return calibrate_layout(pixel, frame_width, frame.height)
+
+    def _calculate_chat_region(self, box: tuple[int, int, int, int]):
+        """计算聊天消息区域（排除左侧列表和底部输入框）"""
+        left, top, width, height = box
+        layout = self._layout
         self._chat_region = {
-            "left": self._window.left + left_panel_width,
-            "top": self._window.top + top_bar_height,
-            "width": self._window.width - left_panel_width - 20,
-            "height": self._window.height - top_bar_height - bottom_panel_height,
+            "left": left + layout.left_panel_width,
+            "top": top + layout.top_bar_height,
+            "width": max(width - layout.left_panel_width - 20, 1),
+            "height": max(height - layout.top_bar_height - layout.bottom_panel_height, 1),
         }
 
     def _capture_chat_area(self) -> str:
@@ -108,30 +222,36 @@ class WeChatMonitor:
         if not self._chat_region:
             return ""
 
+        import mss
+        import mss.tools
+
         with mss.mss() as sct:
             screenshot = sct.grab(self._chat_region)
             tmp_file = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
             mss.tools.to_png(screenshot.rgb, screenshot.size, output=tmp_file.name)
             return tmp_file.name
 
+    @property
+    def text_filter(self) -> TextFilter:
+        return self._text_filter
+
+    def set_text_filter(self, text_filter: TextFilter) -> None:
+        """替换文本过滤器，保留已有的命中统计"""
+        text_filter.merge_stats(self._text_filter)
+        self._text_filter = text_filter
+
+    def set_ocr(self, ocr: BaiduOCR) -> None:
+        self._ocr = ocr
+
     def _is_ui_element(self, text: str) -> bool:
-        """判断是否是UI元素（需要过滤）"""
-        # 过滤单字符
-        if len(text) <= 1:
-            return True
-        # 过滤时间戳
-        if self.TIME_PATTERN.match(text):
-            return True
-        # 过滤UI关键词
-        for kw in self.UI_KEYWORDS:
-            if kw in text:
-                return True
-        return False
+        """判断是否是UI元素或系统提示（需要过滤）"""
+        return self._text_filter.is_noise(text)
 
     def _parse_messages(self, ocr_results: list[dict]) -> list[ChatMessage]:
         """解析OCR结果为消息列表"""
         messages = []
         chat_width = self._chat_region["width"] if self._chat_region else 800
+        self._text_filter.start_frame()
 
         for item in ocr_results:
             text = item.get("words", "").strip()
@@ -160,6 +280,7 @@ class WeChatMonitor:
             return []
 
         try:
+            self._refresh_geometry()
             img_path = self._capture_chat_area()
             if not img_path:
                 return []
@@ -226,6 +347,9 @@ class WeChatMonitor:
             return False
 
         try:
+            import pyautogui
+            import pyperclip
+
             # 激活微信窗口
             self._window.activate()
             time.sleep(0.2)
@@ -237,7 +361,6 @@ class WeChatMonitor:
             time.sleep(0.1)
 
             # 中文需要用剪贴板
-            import pyperclip
             pyperclip.copy(text)
             pyautogui.hotkey("ctrl", "v")
             time.sleep(0.1)
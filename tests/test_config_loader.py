@@ -0,0 +1,83 @@
+import os
+
+from modules.config_loader import ConfigWatcher, load_config, validate_config
+
+VALID_CONFIG = """
+api:
+  api_key: "ai-key"
+baidu_ocr:
+  api_key: "ocr-key"
+  secret_key: "ocr-secret"
+"""
+
+
+def write_config(tmp_path, text):
+    path = tmp_path / "config.yaml"
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_valid_config_passes(tmp_path):
+    config = load_config(write_config(tmp_path, VALID_CONFIG))
+    assert validate_config(config) == []
+
+
+def test_empty_filter_section_uses_defaults(tmp_path):
+    config = load_config(write_config(tmp_path, VALID_CONFIG + "filter:\n  keywords:\n"))
+    assert "撤回了一条消息" in config.filter.keywords
+    assert validate_config(config) == []
+
+
+def test_empty_filter_lists_disable_defaults(tmp_path):
+    text = VALID_CONFIG + "filter:\n  keywords: []\n  patterns: []\n"
+    config = load_config(write_config(tmp_path, text))
+    assert config.filter.keywords == []
+    assert config.filter.patterns == []
+
+
+def test_uncombinable_filter_pattern_is_rejected(tmp_path):
+    text = VALID_CONFIG + "filter:\n  patterns:\n    - '(?i)^ok$'\n"
+    errors = validate_config(load_config(write_config(tmp_path, text)))
+    assert len(errors) == 1
+    assert "(?i)^ok$" in errors[0]
+
+
+def test_wrongly_typed_interval_is_reported(tmp_path):
+    text = VALID_CONFIG + "monitor:\n  check_interval: \"fast\"\n"
+    errors = validate_config(load_config(write_config(tmp_path, text)))
+    assert errors == ["monitor.check_interval 必须是数字: 'fast'"]
+
+
+def rewrite(path, text):
+    # 保证修改时间一定变化，避免文件系统时间精度导致漏检
+    stat = os.stat(path)
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_watcher_returns_none_until_file_changes(tmp_path):
+    path = write_config(tmp_path, VALID_CONFIG)
+    watcher = ConfigWatcher(str(path))
+    assert watcher.poll() is None
+
+    rewrite(path, VALID_CONFIG + "style:\n  default: \"幽默搞笑\"\n")
+    config = watcher.poll()
+    assert config.style.default == "幽默搞笑"
+    assert watcher.poll() is None
+
+
+def test_watcher_rejects_invalid_files(tmp_path):
+    path = write_config(tmp_path, VALID_CONFIG)
+    watcher = ConfigWatcher(str(path))
+
+    rewrite(path, VALID_CONFIG + "monitor: [\n")
+    assert watcher.poll() is None
+
+    rewrite(path, VALID_CONFIG + "monitor:\n  check_interval: \"fast\"\n")
+    assert watcher.poll() is None
+
+    rewrite(path, VALID_CONFIG + "filter:\n  patterns:\n    - '(?i)^ok$'\n")
+    assert watcher.poll() is None
+
+    rewrite(path, VALID_CONFIG + "monitor:\n  check_interval: 5\n")
+    assert watcher.poll().monitor.check_interval == 5
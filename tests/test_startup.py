@@ -0,0 +1,26 @@
+import bench_startup
+from main import check_config
+
+VALID_CONFIG = """
+api:
+  api_key: "ai-key"
+baidu_ocr:
+  api_key: "ocr-key"
+  secret_key: "ocr-secret"
+"""
+
+
+def test_config_load_does_not_import_heavy_modules():
+    result = bench_startup.run_probe()
+    assert result["heavy"] == []
+
+
+def test_check_config_exit_codes(tmp_path):
+    valid = tmp_path / "valid.yaml"
+    valid.write_text(VALID_CONFIG, encoding="utf-8")
+    invalid = tmp_path / "invalid.yaml"
+    invalid.write_text(VALID_CONFIG + "monitor:\n  check_interval: \"fast\"\n", encoding="utf-8")
+
+    assert check_config(str(valid)) == 0
+    assert check_config(str(invalid)) == 1
+    assert check_config(str(tmp_path / "missing.yaml")) == 1
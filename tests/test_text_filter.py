@@ -0,0 +1,68 @@
+import pytest
+
+from modules.config_loader import FilterConfig
+from modules.text_filter import TextFilter
+
+
+def test_match_reports_rule_and_counts_hits():
+    text_filter = TextFilter(FilterConfig())
+
+    assert text_filter.match("a") == TextFilter.LENGTH_RULE
+    assert text_filter.match("14:15") == r"pattern:^\d{1,2}:\d{2}$"
+    assert text_filter.match("张三撤回了一条消息") == "keyword:撤回了一条消息"
+    assert text_filter.match("明天去吃饭吗") is None
+    assert text_filter.match("b") == TextFilter.LENGTH_RULE
+
+    assert text_filter.hit_counts == {
+        TextFilter.LENGTH_RULE: 2,
+        r"pattern:^\d{1,2}:\d{2}$": 1,
+        "keyword:撤回了一条消息": 1,
+    }
+
+
+def test_lines_repeated_across_frames_are_counted_once():
+    text_filter = TextFilter(FilterConfig())
+    for _ in range(3):
+        text_filter.start_frame()
+        assert text_filter.is_noise("14:15")
+        assert text_filter.is_noise("14:15")
+    text_filter.start_frame()
+    text_filter.is_noise("14:16")
+
+    assert text_filter.hit_counts == {r"pattern:^\d{1,2}:\d{2}$": 2}
+
+
+def test_longer_keyword_wins_at_same_position():
+    text_filter = TextFilter(FilterConfig(keywords=["红包", "微信红包"], patterns=[]))
+    assert text_filter.match("微信红包") == "keyword:微信红包"
+
+
+def test_scoped_inline_flags_are_supported():
+    text_filter = TextFilter(FilterConfig(keywords=[], patterns=["(?i:^ok$)"]))
+    assert text_filter.is_noise("OK")
+    assert not text_filter.is_noise("okay")
+
+
+@pytest.mark.parametrize(
+    "patterns",
+    [
+        ["(?i)^ok$"],
+        [r"^(\w)\1$"],
+        ["(?P<a>x)", "(?P<a>y)"],
+        ["(["],
+    ],
+)
+def test_build_regex_rejects_patterns_that_cannot_be_combined(patterns):
+    with pytest.raises(ValueError):
+        TextFilter.build_regex(FilterConfig(patterns=patterns))
+
+
+def test_merge_stats_keeps_previous_hits():
+    old = TextFilter(FilterConfig())
+    old.match("a")
+    new = TextFilter(FilterConfig(min_length=3))
+    new.merge_stats(old)
+    new.start_frame()
+    new.match("a")
+    new.match("ab")
+    assert new.hit_counts == {TextFilter.LENGTH_RULE: 2}
@@ -0,0 +1,128 @@
+from types import SimpleNamespace
+
+from modules.wechat_monitor import PanelLayout, WeChatMonitor, calibrate_layout
+
+WIDTH, HEIGHT = 900, 700
+DIVIDER_X = 300
+TOP_EDGE_Y = 56
+INPUT_EDGE_Y = 560
+
+
+def synthetic_frame(x: int, y: int) -> tuple:
+    """图标栏 + 带头像的聊天列表 + 标题栏 / 消息区 / 输入框"""
+    if x < 60:
+        return 40, 40, 40
+    if x < DIVIDER_X:
+        # 头像左边缘在每个列表项的同一x上，但不贯穿所有行
+        if 80 < x < 120 and (y // 64) % 2 == 0:
+            return 10, 100, 200
+        return 230, 230, 230
+    if y < TOP_EDGE_Y:
+        return 245, 245, 245
+    if y >= INPUT_EDGE_Y:
+        return 255, 255, 255
+    # 消息气泡只覆盖部分列
+    if 400 < x < 600 and 200 < y < 240:
+        return 150, 230, 120
+    return 220, 220, 220
+
+
+def test_calibrate_layout_detects_panel_edges():
+    layout = calibrate_layout(synthetic_frame, WIDTH, HEIGHT)
+    assert layout == PanelLayout(
+        left_panel_width=DIVIDER_X,
+        top_bar_height=TOP_EDGE_Y,
+        bottom_panel_height=HEIGHT - INPUT_EDGE_Y,
+    )
+
+
+def test_calibrate_layout_ignores_dense_bubble_edges():
+    def busy_frame(x: int, y: int) -> tuple:
+        # 1px 分割线，且几乎每行都有从同一x开始的对方消息气泡
+        if x == DIVIDER_X:
+            return 200, 200, 200
+        if DIVIDER_X + 60 <= x < DIVIDER_X + 260 and TOP_EDGE_Y <= y < INPUT_EDGE_Y and y % 40 < 36:
+            return 255, 255, 255
+        return synthetic_frame(x, y)
+
+    layout = calibrate_layout(busy_frame, WIDTH, HEIGHT)
+    assert layout.left_panel_width == DIVIDER_X + 1
+
+
+def test_calibrate_layout_falls_back_to_defaults_on_blank_frame():
+    layout = calibrate_layout(lambda x, y: (255, 255, 255), WIDTH, HEIGHT)
+    assert layout == PanelLayout()
+
+
+def make_monitor(window, layouts):
+    monitor = WeChatMonitor(ocr=None)
+    monitor._window = window
+    calls = []
+
+    def fake_calibrate(left, top, width, height):
+        calls.append((left, top, width, height))
+        result = layouts.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monitor._calibrate_layout = fake_calibrate
+    return monitor, calls
+
+
+def test_refresh_geometry_only_recalibrates_on_change():
+    window = SimpleNamespace(box=(100, 50, WIDTH, HEIGHT), isMinimized=False)
+    monitor, calls = make_monitor(window, [PanelLayout(300, 56, 140), PanelLayout(320, 56, 140)])
+
+    monitor._refresh_geometry()
+    monitor._refresh_geometry()
+    assert len(calls) == 1
+    assert monitor._chat_region == {"left": 400, "top": 106, "width": 580, "height": 504}
+
+    window.box = (0, 0, WIDTH, HEIGHT)
+    monitor._refresh_geometry()
+    assert len(calls) == 2
+    assert monitor._chat_region["left"] == 320
+
+
+def test_refresh_geometry_keeps_region_while_minimized():
+    window = SimpleNamespace(box=(100, 50, WIDTH, HEIGHT), isMinimized=False)
+    monitor, calls = make_monitor(window, [PanelLayout(300, 56, 140)])
+    monitor._refresh_geometry()
+    region = dict(monitor._chat_region)
+
+    window.box = (-32000, -32000, 160, 28)
+    window.isMinimized = True
+    monitor._refresh_geometry()
+
+    assert len(calls) == 1
+    assert monitor._chat_region == region
+
+
+def test_refresh_geometry_backs_off_after_failed_calibration():
+    window = SimpleNamespace(box=(100, 50, WIDTH, HEIGHT), isMinimized=False)
+    monitor, calls = make_monitor(window, [RuntimeError("grab failed"), PanelLayout(300, 56, 140)])
+
+    monitor._refresh_geometry()
+    assert monitor._chat_region["left"] == 100 + PanelLayout().left_panel_width
+
+    # 退避期间不重新截图
+    monitor._refresh_geometry()
+    assert len(calls) == 1
+
+    monitor._calibrate_retry_at = 0
+    monitor._refresh_geometry()
+    assert len(calls) == 2
+    assert monitor._chat_region["left"] == 400
+
+
+def test_failed_calibration_keeps_layout_for_same_size():
+    window = SimpleNamespace(box=(100, 50, WIDTH, HEIGHT), isMinimized=False)
+    monitor, calls = make_monitor(window, [PanelLayout(300, 56, 140), RuntimeError("grab failed")])
+    monitor._refresh_geometry()
+
+    window.box = (200, 80, WIDTH, HEIGHT)
+    monitor._refresh_geometry()
+
+    assert len(calls) == 2
+    assert monitor._chat_region == {"left": 500, "top": 136, "width": 580, "height": 504}